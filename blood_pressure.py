@@ -0,0 +1,30 @@
+"""
+Blood Pressure Parsing
+
+Shared parser for "systolic/diastolic" readings, used by the sanitizer,
+the risk scorer, and the classifiers.
+"""
+
+import re
+from functools import lru_cache
+from typing import Optional, Tuple
+
+_BP_RE = re.compile(r"^(\d+)/(\d+)$")
+_BP_BAD = frozenset({"N/A", "NA", "INVALID", "UNKNOWN", "INVALID_BP_FORMAT", ""})
+
+
+@lru_cache(maxsize=4096)
+def parse_blood_pressure(bp: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse a "systolic/diastolic" string into a tuple of ints.
+    Returns None for placeholders and malformed values like "150/" or "/90".
+    Results are cached per unique string since readings repeat often.
+    """
+    if bp.upper() in _BP_BAD:
+        return None
+
+    match = _BP_RE.match(bp)
+    if not match:
+        return None
+
+    return int(match.group(1)), int(match.group(2))
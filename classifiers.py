@@ -0,0 +1,66 @@
+"""
+Fused Patient Classifier
+
+Runs the high-risk, fever, and data quality classifiers in a single pass
+over the patient list, parsing each blood pressure reading only once.
+"""
+
+from typing import List, Tuple
+from patient import Patient
+from blood_pressure import parse_blood_pressure
+from risk_scorer import score_bp, calculate_temp_risk, calculate_age_risk
+from high_risk_classifier import HIGH_RISK_THRESHOLD
+from fever_classifier import FEVER_THRESHOLD
+from data_quality_classifier import (
+    is_valid_bp_reading,
+    is_valid_age,
+    is_valid_temperature,
+)
+
+
+def classify_all(
+    patients: List[Patient],
+) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Classify all patients in a single sweep.
+
+    Produces the same results as calling get_high_risk_patients,
+    get_fever_patients, and get_data_quality_issues separately, using the
+    same scoring and validation helpers, but walks the patient list once
+    and parses each blood pressure string once.
+
+    Args:
+        patients: List of Patient objects to evaluate
+
+    Returns:
+        Tuple of (high-risk IDs, fever IDs, data quality issue IDs)
+    """
+    high_risk_ids = []
+    fever_ids = []
+    data_quality_ids = []
+
+    for patient in patients:
+        age = patient.age
+        temperature = patient.temperature
+        bp_str = patient.blood_pressure
+        bp = parse_blood_pressure(bp_str) if isinstance(bp_str, str) else None
+
+        if bp is None:
+            bp_ok = False
+            bp_risk = 0
+        else:
+            bp_ok = is_valid_bp_reading(*bp)
+            bp_risk = score_bp(*bp)
+
+        temp_risk = calculate_temp_risk(temperature)
+        age_risk = calculate_age_risk(age)
+        if bp_risk + temp_risk + age_risk >= HIGH_RISK_THRESHOLD:
+            high_risk_ids.append(patient.patient_id)
+
+        if temperature is not None and temperature >= FEVER_THRESHOLD:
+            fever_ids.append(patient.patient_id)
+
+        if not (bp_ok and is_valid_age(age) and is_valid_temperature(temperature)):
+            data_quality_ids.append(patient.patient_id)
+
+    return high_risk_ids, fever_ids, data_quality_ids
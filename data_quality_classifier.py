@@ -1,5 +1,6 @@
 from typing import List, Dict, Any
 from patient import Patient
+from blood_pressure import parse_blood_pressure
 
 
 def get_data_quality_issues(patients: List[Patient]) -> List[str]:
@@ -17,27 +18,16 @@ def get_data_quality_issues(patients: List[Patient]) -> List[str]:
     Returns:
         List of patient IDs with data quality issues
     """
-    patient_ids_with_issues = []
-
-    for patient in patients:
-        has_issue = False
-
-        # Check for missing or invalid blood pressure
-        if not _is_valid_bp(patient.blood_pressure):
-            has_issue = True
-
-        # Check for missing or invalid age
-        if not _is_valid_age(patient.age):
-            has_issue = True
-
-        # Check for missing or invalid temperature
-        if not _is_valid_temperature(patient.temperature):
-            has_issue = True
-
-        if has_issue:
-            patient_ids_with_issues.append(patient.patient_id)
-
-    return patient_ids_with_issues
+    # Stop at the first missing or invalid field (BP, age, temperature)
+    return [
+        patient.patient_id
+        for patient in patients
+        if not (
+            _is_valid_bp(patient.blood_pressure)
+            and is_valid_age(patient.age)
+            and is_valid_temperature(patient.temperature)
+        )
+    ]
 
 
 def _is_valid_bp(bp) -> bool:
@@ -45,43 +35,28 @@ def _is_valid_bp(bp) -> bool:
     if bp is None or not isinstance(bp, str):
         return False
 
-    parts = bp.split("/")
-    if len(parts) != 2:
+    parsed = parse_blood_pressure(bp)
+    if parsed is None:
         return False
 
-    try:
-        systolic = int(parts[0].strip())
-        diastolic = int(parts[1].strip())
-        # Validate reasonable BP ranges
-        if systolic <= 0 or systolic > 300 or diastolic <= 0 or diastolic > 200:
-            return False
-        return True
-    except (ValueError, AttributeError):
-        return False
+    return is_valid_bp_reading(*parsed)
 
 
-def _is_valid_age(age) -> bool:
-    """Check if age is valid."""
-    if age is None or not isinstance(age, (int, float)):
-        return False
+def is_valid_bp_reading(systolic: int, diastolic: int) -> bool:
+    """Check if a parsed blood pressure reading is in a reasonable range."""
+    return 0 < systolic <= 300 and 0 < diastolic <= 200
 
-    # Validate reasonable age range
-    if age < 0 or age > 150:
-        return False
 
-    return True
+def is_valid_age(age) -> bool:
+    """Check if age is valid."""
+    # Validate presence and reasonable age range
+    return age is not None and 0 <= age <= 150
 
 
-def _is_valid_temperature(temperature) -> bool:
+def is_valid_temperature(temperature) -> bool:
     """Check if temperature is valid."""
-    if temperature is None or not isinstance(temperature, (int, float)):
-        return False
-
-    # Validate reasonable temperature range
-    if temperature <= 0 or temperature > 115:
-        return False
-
-    return True
+    # Validate presence and reasonable temperature range
+    return temperature is not None and 0 < temperature <= 115
 
 
 def debug_data_quality_issues(patients: List[Patient]) -> List[Dict[str, Any]]:
@@ -99,14 +74,19 @@ def debug_data_quality_issues(patients: List[Patient]) -> List[Dict[str, Any]]:
     issues_details = []
 
     for patient in patients:
-        patient_issues = {
-            "patient_id": patient.patient_id,
-            "issues": [],
-        }
+        bp_ok = _is_valid_bp(patient.blood_pressure)
+        age_ok = is_valid_age(patient.age)
+        temp_ok = is_valid_temperature(patient.temperature)
+
+        # Only build a record for patients that actually have issues
+        if bp_ok and age_ok and temp_ok:
+            continue
+
+        issues = []
 
         # Check blood pressure
-        if not _is_valid_bp(patient.blood_pressure):
-            patient_issues["issues"].append(
+        if not bp_ok:
+            issues.append(
                 {
                     "field": "blood_pressure",
                     "status": "missing/invalid",
@@ -115,14 +95,14 @@ def debug_data_quality_issues(patients: List[Patient]) -> List[Dict[str, Any]]:
             )
 
         # Check age
-        if not _is_valid_age(patient.age):
-            patient_issues["issues"].append(
+        if not age_ok:
+            issues.append(
                 {"field": "age", "status": "missing/invalid", "value": patient.age}
             )
 
         # Check temperature
-        if not _is_valid_temperature(patient.temperature):
-            patient_issues["issues"].append(
+        if not temp_ok:
+            issues.append(
                 {
                     "field": "temperature",
                     "status": "missing/invalid",
@@ -130,9 +110,7 @@ def debug_data_quality_issues(patients: List[Patient]) -> List[Dict[str, Any]]:
                 }
             )
 
-        # Only add to results if there are issues
-        if patient_issues["issues"]:
-            issues_details.append(patient_issues)
+        issues_details.append({"patient_id": patient.patient_id, "issues": issues})
 
     return issues_details
 
@@ -148,17 +126,16 @@ def print_data_quality_report(patients: List[Patient]) -> None:
     print("DATA QUALITY REPORT")
     print("=" * 80)
 
-    # Get summary
-    patient_ids_with_issues = get_data_quality_issues(patients)
+    # Get detailed issues; the summary is derived from them
+    detailed_issues = debug_data_quality_issues(patients)
+    patient_ids_with_issues = [issue["patient_id"] for issue in detailed_issues]
+
     print(f"\nTotal patients checked: {len(patients)}")
     print(f"Patients with data quality issues: {len(patient_ids_with_issues)}")
 
     if patient_ids_with_issues:
         print(f"\nPatient IDs with issues: {', '.join(patient_ids_with_issues)}")
 
-    # Get detailed issues
-    detailed_issues = debug_data_quality_issues(patients)
-
     if detailed_issues:
         print("\n" + "=" * 80)
         print("DETAILED ISSUES")
@@ -166,7 +143,6 @@ def print_data_quality_report(patients: List[Patient]) -> None:
 
         for patient_issue in detailed_issues:
             print(f"\nPatient ID: {patient_issue['patient_id']}")
-            print(f"Name: {patient_issue['name']}")
             print("Issues:")
             for issue in patient_issue["issues"]:
                 print(
@@ -181,23 +157,12 @@ def print_data_quality_report(patients: List[Patient]) -> None:
 # Example usage
 if __name__ == "__main__":
     from routes import getPatients
-    from patient import Patient
 
     print("Fetching patient data from API...\n")
 
     # Use the getPatients function from routes.py
     result = getPatients()
-
-    # Convert dictionaries back to Patient objects
-    all_patients = []
-    for patient_dict in result.get("data", []):
-        patient = Patient(
-            patient_id=patient_dict["patient_id"],
-            age=patient_dict["age"],
-            blood_pressure=patient_dict["blood_pressure"],
-            temperature=patient_dict["temperature"],
-        )
-        all_patients.append(patient)
+    all_patients = result.get("data", [])
 
     print(f"\nTotal patients fetched: {len(all_patients)}\n")
 
@@ -7,6 +7,8 @@ Identifies patients with elevated temperature (≥ 99.6°F).
 from typing import List
 from patient import Patient
 
+FEVER_THRESHOLD = 99.6  # °F
+
 
 def get_fever_patients(patients: List[Patient]) -> List[str]:
     """
@@ -18,14 +20,10 @@ def get_fever_patients(patients: List[Patient]) -> List[str]:
     Returns:
         List of patient IDs with temperature ≥ 99.6°F
     """
-    fever_ids = []
-
-    for patient in patients:
-        # Check if temperature is valid and >= 99.6
-        if patient.temperature is not None and isinstance(
-            patient.temperature, (int, float)
-        ):
-            if patient.temperature >= 99.6:
-                fever_ids.append(patient.patient_id)
-
-    return fever_ids
+    # Temperature must be valid and >= 99.6
+    return [
+        patient.patient_id
+        for patient in patients
+        if patient.temperature is not None
+        and patient.temperature >= FEVER_THRESHOLD
+    ]
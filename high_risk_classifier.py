@@ -9,6 +9,8 @@ from typing import List
 from patient import Patient
 from risk_scorer import calculate_total_risk
 
+HIGH_RISK_THRESHOLD = 4
+
 
 def get_high_risk_patients(patients: List[Patient]) -> List[str]:
     """
@@ -26,11 +28,8 @@ def get_high_risk_patients(patients: List[Patient]) -> List[str]:
     Returns:
         List of patient IDs with risk score ≥ 4
     """
-    high_risk_ids = []
-
-    for patient in patients:
-        total_risk = calculate_total_risk(patient)
-        if total_risk >= 4:
-            high_risk_ids.append(patient.patient_id)
-
-    return high_risk_ids
+    return [
+        patient.patient_id
+        for patient in patients
+        if calculate_total_risk(patient) >= HIGH_RISK_THRESHOLD
+    ]
@@ -0,0 +1,26 @@
+"""
+Shared HTTP Session
+
+All KSense API calls go through one requests.Session so connections (and
+their TLS handshakes) are reused across pages. Retries with exponential
+backoff on rate limits and server errors are handled by urllib3.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+retry_policy = Retry(
+    total=10,
+    backoff_factor=1,
+    status_forcelist=[429, 500, 502, 503, 504],
+    # On 429/503 wait as long as the server's Retry-After says, not the backoff
+    respect_retry_after_header=True,
+    raise_on_status=False,  # Hand back the last response instead of raising
+)
+
+session = requests.Session()
+session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=retry_policy),
+)
@@ -1,8 +1,17 @@
+import sys
 from typing import Any, Dict, Optional
 
 
 class Patient:
-    """Standardized patient data object"""
+    """
+    Standardized patient data object.
+
+    After sanitization each field is either None or its annotated type, so
+    consumers only need an `is not None` check before using a value.
+    patient_id must be an exact str (not a subclass) so it can be interned.
+    """
+
+    __slots__ = ("patient_id", "age", "blood_pressure", "temperature")
 
     def __init__(
         self,
@@ -11,7 +20,12 @@ class Patient:
         blood_pressure: Optional[str],
         temperature: Optional[float],
     ):
-        self.patient_id = patient_id
+        if type(patient_id) is not str:
+            raise TypeError(
+                f"patient_id must be a str, not {type(patient_id).__name__}"
+            )
+        # Interned so ID sets and comparisons hit the identity fast path
+        self.patient_id = sys.intern(patient_id)
         self.age = age
         self.blood_pressure = blood_pressure
         self.temperature = temperature
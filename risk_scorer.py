@@ -11,6 +11,8 @@ Total Risk Score = BP Score + Temp Score + Age Score
 
 from typing import Optional
 from patient import Patient
+from blood_pressure import parse_blood_pressure
+from fever_classifier import FEVER_THRESHOLD
 
 
 def calculate_bp_risk(bp: Optional[str]) -> int:
@@ -37,35 +39,32 @@ def calculate_bp_risk(bp: Optional[str]) -> int:
         return 0
 
     # Parse BP value
-    parts = bp.split("/")
-    if len(parts) != 2:
+    parsed = parse_blood_pressure(bp)
+    if parsed is None:
         return 0
+    systolic, diastolic = parsed
 
-    try:
-        systolic = int(parts[0].strip())
-        diastolic = int(parts[1].strip())
-    except (ValueError, AttributeError):
-        return 0
+    return score_bp(systolic, diastolic)
+
+
+def score_bp(systolic: int, diastolic: int) -> int:
+    """
+    Score already-parsed systolic/diastolic readings (see calculate_bp_risk).
+
+    Each stage threshold contributes one comparison, so the score is a sum
+    of booleans rather than an if/elif chain.
+
+    Args:
+        systolic: Systolic reading
+        diastolic: Diastolic reading
 
-    # Calculate risk for systolic
-    systolic_risk = 0
-    if systolic < 120:
-        systolic_risk = 0
-    elif 120 <= systolic <= 129:
-        systolic_risk = 1
-    elif 130 <= systolic <= 139:
-        systolic_risk = 2
-    else:  # systolic >= 140
-        systolic_risk = 3
-
-    # Calculate risk for diastolic
-    diastolic_risk = 0
-    if diastolic < 80:
-        diastolic_risk = 0
-    elif 80 <= diastolic <= 89:
-        diastolic_risk = 2
-    else:  # diastolic >= 90
-        diastolic_risk = 3
+    Returns:
+        Risk score from 0-3
+    """
+    # Systolic: 120-129 -> 1, 130-139 -> 2, >=140 -> 3
+    systolic_risk = (systolic >= 120) + (systolic >= 130) + (systolic >= 140)
+    # Diastolic: 80-89 -> 2, >=90 -> 3
+    diastolic_risk = 2 * (diastolic >= 80) + (diastolic >= 90)
 
     # Return the higher risk (as per requirements)
     return max(systolic_risk, diastolic_risk)
@@ -87,15 +86,11 @@ def calculate_temp_risk(temperature: Optional[float]) -> int:
     Returns:
         Risk score from 0-2
     """
-    if temperature is None or not isinstance(temperature, (int, float)):
+    if temperature is None:
         return 0
 
-    if temperature <= 99.5:
-        return 0
-    elif 99.6 <= temperature <= 100.9:
-        return 1
-    else:  # temperature >= 101.0
-        return 2
+    # ≤99.5 -> 0, 99.6-100.9 -> 1, ≥101.0 -> 2
+    return (temperature >= FEVER_THRESHOLD) + (temperature >= 101.0)
 
 
 def calculate_age_risk(age: Optional[int]) -> int:
@@ -114,15 +109,11 @@ def calculate_age_risk(age: Optional[int]) -> int:
     Returns:
         Risk score from 0-2
     """
-    if age is None or not isinstance(age, (int, float)):
+    if age is None:
         return 0
 
-    if age < 40:
-        return 0
-    elif 40 <= age <= 65:
-        return 1
-    else:  # age > 65
-        return 2
+    # <40 -> 0, 40-65 -> 1, >65 -> 2
+    return (age >= 40) + (age > 65)
 
 
 def calculate_total_risk(patient: Patient) -> int:
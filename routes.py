@@ -1,48 +1,45 @@
 import requests
+import logging
 import os
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from dotenv import load_dotenv
 from datetime import datetime
 from sanitizer import sanitize_patient
+from http_client import session
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+PATIENTS_URL = "https://assessment.ksensetech.com/api/patients"
+MAX_FETCH_WORKERS = 4
+# Minimum seconds between the starts of two page requests, same as the old
+# sequential loop's time.sleep(1)
+REQUEST_INTERVAL = 1
+
+# One request may start per REQUEST_INTERVAL; up to MAX_FETCH_WORKERS can be
+# in flight at once. This only paces the first attempt of each request:
+# urllib3 retries inside session.get are paced by the Retry backoff / Retry-After.
+_request_slots = threading.Semaphore(1)
+
 
 def getPatient():
     KSense_api_key = os.getenv("KSENSE_API_KEY")
     url = "https://assessment.ksensetech.com/api/patients?page=1&limit=1"
 
     headers = {"x-api-key": KSense_api_key, "Content-Type": "application/json"}
-    max_retries = 3
-    backoff_factor = 1
-    response = None
-
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(url, headers=headers, timeout=5)
-            if response.status_code == 200:
-                break
-            elif response.status_code >= 500 and attempt < max_retries - 1:
-                wait_time = backoff_factor * (2**attempt)
-                time.sleep(wait_time)
-            else:
-                break
-        except requests.RequestException as e:
-            if attempt < max_retries - 1:
-                wait_time = backoff_factor * (2**attempt)
-                time.sleep(wait_time)
-            else:
-                raise
+    response = session.get(url, headers=headers, timeout=5)
 
     if response and response.status_code == 200:
         data = response.json()
 
         # Sanitize the patient data
-        sanitized_patients = []
-        if "data" in data and len(data["data"]) > 0:
-            for raw_patient in data["data"]:
-                sanitized_patient = sanitize_patient(raw_patient)
-                sanitized_patients.append(sanitized_patient.to_dict())
+        sanitized_patients = [
+            sanitize_patient(raw_patient) for raw_patient in data.get("data", ())
+        ]
 
         # Return in the ideal response format
         return {
@@ -60,87 +57,85 @@ def getPatient():
         }
 
 
+def _throttled_get(url, headers, timeout):
+    """GET a URL once the request slot is free; the slot frees up after REQUEST_INTERVAL."""
+    _request_slots.acquire()
+    release_timer = threading.Timer(REQUEST_INTERVAL, _request_slots.release)
+    release_timer.daemon = True
+    release_timer.start()
+    return session.get(url, headers=headers, timeout=timeout)
+
+
+def _fetch_page(page, headers):
+    """
+    Fetch a single page of patients. Retries and backoff happen in the session.
+    Returns the raw response body, or None if the page could not be fetched.
+    """
+    url = f"{PATIENTS_URL}?page={page}"
+
+    try:
+        response = _throttled_get(url, headers=headers, timeout=10)
+    except requests.RequestException as e:
+        print(f"Error fetching page {page}: {str(e)}")
+        return None
+
+    if response.status_code != 200:
+        print(f"Failed to fetch page {page}: Status {response.status_code}")
+        return None
+
+    try:
+        data = response.json()
+    except ValueError as e:  # Includes requests.JSONDecodeError
+        print(f"Invalid JSON body on page {page}: {str(e)}")
+        return None
+
+    logger.debug("raw page %d: %s", page, data)
+    if "pagination" in data:
+        print(f"Fetched page {page}/{data['pagination'].get('totalPages', '?')}")
+    return data
+
+
 def getPatients():
     KSense_api_key = os.getenv("KSENSE_API_KEY")
-    base_url = "https://assessment.ksensetech.com/api/patients"
 
     headers = {"x-api-key": KSense_api_key, "Content-Type": "application/json"}
-    max_retries = 10
-    backoff_factor = 1
     all_patients = []
     last_pagination = {}  # Store the last pagination response
 
-    page = 1
-    has_next = True
-
     maxPages = 15  # Safety limit to avoid infinite loops
 
-    # Loop through pages dynamically using pagination metadata
-    while page <= maxPages:
-        url = f"{base_url}?page={page}"
-
-        # Retry logic with exponential backoff
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(url, headers=headers, timeout=10)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    print("***rawdata:", data)
-
-                    # Extract and sanitize patients from 'data' or 'patients' field
-                    raw_patients = data.get("data") or data.get("patients") or []
-                    # Sanitize each patient to match the standardized format
-                    for raw_patient in raw_patients:
-                        sanitized_patient = sanitize_patient(raw_patient)
-                        all_patients.append(sanitized_patient.to_dict())
-
-                    # Check pagination metadata to see if there are more pages
-                    if "pagination" in data:
-                        last_pagination = data["pagination"]  # Store it
-                        has_next = data["pagination"].get("hasNext", False)
-                        print(
-                            f"Fetched page {page}/{data['pagination'].get('totalPages', '?')}"
-                        )
-                    else:
-                        has_next = False
-
-                    break
-                elif response.status_code == 429:
-                    # Rate limit error - wait longer before retrying
-                    wait_time = 2 * (2**attempt)
-                    print(f"Rate limit hit on page {page}, waiting {wait_time}s...")
-                    time.sleep(wait_time)
-                elif response.status_code >= 500 and attempt < max_retries - 1:
-                    # Server error - retry with exponential backoff
-                    wait_time = backoff_factor * (2**attempt)
-                    print(f"Server error on page {page}, retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                else:
-                    # Client error or final retry - don't retry
-                    print(f"Failed to fetch page {page}: Status {response.status_code}")
-                    has_next = False
-                    break
-
-            except requests.RequestException as e:
-                if attempt < max_retries - 1:
-                    wait_time = backoff_factor * (2**attempt)
-                    print(f"Request error on page {page}, retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                else:
-                    print(
-                        f"Error fetching page {page} after {max_retries} attempts: {str(e)}"
+    # Page 1 tells us how many pages there are; fetch the rest concurrently
+    first_page = _fetch_page(1, headers)
+    pages = [first_page]
+
+    if first_page and "pagination" in first_page:
+        last_pagination = first_page["pagination"]
+        if last_pagination.get("hasNext", False):
+            total_pages = min(last_pagination.get("totalPages", maxPages), maxPages)
+            with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+                pages.extend(
+                    executor.map(
+                        partial(_fetch_page, headers=headers), range(2, total_pages + 1)
                     )
-                    has_next = False
-                    break
-
-        # Add delay between page requests to avoid rate limiting
-        if has_next:
-            time.sleep(1)  # Wait 1 second between each page request
-
-        page += 1
-
-    print("$$$sanitized total patients:", all_patients)
+                )
+
+    # Pages come back in order, so patients keep the API's ordering
+    for data in pages:
+        if data is None:
+            continue
+
+        # Extract and sanitize patients from 'data' or 'patients' field
+        all_patients.extend(
+            sanitize_patient(raw_patient)
+            for raw_patient in data.get("data") or data.get("patients") or ()
+        )
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "sanitized %d patients: %s",
+            len(all_patients),
+            [patient.to_dict() for patient in all_patients],
+        )
     # Return in the ideal response format
     return {
         "data": all_patients,
@@ -156,7 +151,7 @@ def getPatients():
             "timestamp": datetime.now().isoformat() + "Z",
             "version": "v1.0",
             "requestId": f"req_{int(time.time())}",
-            "sourcePages": last_pagination.get("totalPages", page - 1),  # Track source
+            "sourcePages": last_pagination.get("totalPages", len(pages)),  # Track source
         },
     }
 
@@ -166,4 +161,5 @@ if __name__ == "__main__":
     # print(patient_data)
 
     patients_data = getPatients()
+    patients_data["data"] = [patient.to_dict() for patient in patients_data["data"]]
     print("!!!Sanitized data with ideal format:", patients_data)
@@ -1,7 +1,7 @@
 from typing import Any, Dict, Optional
 from datetime import datetime
 from patient import Patient
-import re
+from blood_pressure import parse_blood_pressure
 
 
 def validate_blood_pressure(bp_value: Any) -> Optional[str]:
@@ -13,24 +13,10 @@ def validate_blood_pressure(bp_value: Any) -> Optional[str]:
     if bp_value is None or bp_value == "":
         return None
 
-    bp_str = str(bp_value).strip()
+    bp_str = bp_value if isinstance(bp_value, str) else str(bp_value)
+    bp_str = bp_str.strip()
 
-    # Check for non-numeric placeholders
-    # what about other invalid strings?
-    if bp_str.upper() in ["N/A", "NA", "INVALID", "UNKNOWN", "INVALID_BP_FORMAT"]:
-        return None
-
-    # Validate format: must be "xxx/yyy" with numbers
-    bp_pattern = r"^(\d+)/(\d+)$"
-    match = re.match(bp_pattern, bp_str)
-
-    if not match:
-        # Check for incomplete formats like "150/" or "/90"
-        if "/" in bp_str:
-            parts = bp_str.split("/")
-            if len(parts) == 2:
-                if not parts[0] or not parts[1]:  # Missing systolic or diastolic
-                    return None
+    if parse_blood_pressure(bp_str) is None:
         return None
 
     return bp_str
@@ -41,6 +27,10 @@ def validate_age(age_value: Any) -> Optional[int]:
     Validate age value.
     Returns None for null, undefined, empty, or non-numeric values.
     """
+    # JSON integers are the common case; skip the generic conversion
+    if isinstance(age_value, int) and not isinstance(age_value, bool):
+        return age_value
+
     if age_value is None or age_value == "":
         return None
 
@@ -59,6 +49,10 @@ def validate_temperature(temp_value: Any) -> Optional[float]:
     Validate temperature value.
     Returns None for null, undefined, empty, or non-numeric values.
     """
+    # JSON numbers are the common case; skip the placeholder string checks
+    if isinstance(temp_value, (int, float)) and not isinstance(temp_value, bool):
+        return float(temp_value)
+
     if temp_value is None or temp_value == "":
         return None
 
@@ -80,8 +74,11 @@ def sanitize_patient(patient_data: Dict[str, Any]) -> Patient:
     Handles various field names and data types.
     Sets invalid data to None instead of default values.
     """
-    # Handle patient_id variations
+    # Handle patient_id variations; the API normally sends a plain string.
+    # Anything else, str subclasses included, becomes a plain str.
     patient_id = patient_data.get("patient_id")
+    if type(patient_id) is not str:
+        patient_id = str(patient_id)
 
     # Handle age with validation
     age_raw = patient_data.get("age")
@@ -96,7 +93,7 @@ def sanitize_patient(patient_data: Dict[str, Any]) -> Patient:
     temperature = validate_temperature(temp_raw)
 
     return Patient(
-        patient_id=str(patient_id),
+        patient_id=patient_id,
         age=age,  # Now can be None
         blood_pressure=blood_pressure,  # Now can be None
         temperature=temperature,  # Now can be None
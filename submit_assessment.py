@@ -9,6 +9,7 @@ import json
 import requests
 from typing import Dict, List, Any
 from dotenv import load_dotenv
+from http_client import session
 
 load_dotenv()
 
@@ -53,7 +54,7 @@ def submit_to_ksense(
     print("=" * 80 + "\n")
 
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=10)
+        response = session.post(url, json=payload, headers=headers, timeout=10)
 
         if response.status_code == 200:
             return response.json()
@@ -5,34 +5,62 @@ Tests high-risk, fever, and data quality classifiers to ensure
 they capture the correct number of patients (not too few, not too many).
 """
 
+import os
+import sys
+
+import pytest
+
 from patient import Patient
-from high_risk_classifier import get_high_risk_patients
-from fever_classifier import get_fever_patients
+from sanitizer import sanitize_patient
+from classifiers import classify_all
+from high_risk_classifier import get_high_risk_patients, HIGH_RISK_THRESHOLD
+from fever_classifier import get_fever_patients, FEVER_THRESHOLD
 from data_quality_classifier import get_data_quality_issues
-from risk_scorer import calculate_total_risk, get_risk_breakdown
+from risk_scorer import get_risk_breakdown
+
+# Detail-row labels, indexed by the corresponding boolean flag
+_STATUS = ("Normal", "HIGH-RISK ⚠️")
+_FEVER = ("", "FEVER 🌡️")
+_DATA_ISSUE = ("", "DATA ISSUE ❌")
+
+# By default, fixtures larger than this skip the per-patient detail block
+_DETAIL_LIMIT = 50
+
+
+def _default_verbose():
+    """Detail output is on unless KSENSE_QUIET=1 or running under pytest."""
+    return (
+        os.getenv("KSENSE_QUIET") != "1" and "PYTEST_CURRENT_TEST" not in os.environ
+    )
 
 
 def run_test(
-    test_name, patients, expected_high_risk, expected_fever, expected_data_quality
+    test_name,
+    patients,
+    expected_high_risk,
+    expected_fever,
+    expected_data_quality,
+    verbose=None,
 ):
     """
     Run a single test case and compare results with expected values.
 
     Args:
         test_name: Name of the test
-        patients: List of Patient objects
+        patients: Sequence of Patient objects
         expected_high_risk: Expected number of high-risk patients
         expected_fever: Expected number of fever patients
         expected_data_quality: Expected number of patients with data quality issues
+        verbose: Print per-patient risk scores. None (the default) prints them
+            when _default_verbose() allows and the fixture has at most
+            _DETAIL_LIMIT patients; an explicit True always prints them.
     """
     print(f"\n{'=' * 80}")
     print(f"TEST: {test_name}")
     print(f"{'=' * 80}")
 
-    # Run classifiers
-    high_risk_ids = get_high_risk_patients(patients)
-    fever_ids = get_fever_patients(patients)
-    data_quality_ids = get_data_quality_issues(patients)
+    # Run all classifiers in a single pass
+    high_risk_ids, fever_ids, data_quality_ids = classify_all(patients)
 
     # Display results
     print(f"\nResults:")
@@ -44,23 +72,29 @@ def run_test(
         f"  Data Quality Issues: {len(data_quality_ids)} (expected: {expected_data_quality})"
     )
 
+    if verbose is None:
+        verbose = _default_verbose() and len(patients) <= _DETAIL_LIMIT
+
     # Show detailed breakdown for high-risk patients
-    if patients:
+    if verbose and patients:
         print(f"\nDetailed Risk Scores:")
+        rows = []
         for patient in patients:
             breakdown = get_risk_breakdown(patient)
-            status = "HIGH-RISK ⚠️" if breakdown["total_score"] >= 4 else "Normal"
-            fever_status = (
-                "FEVER 🌡️" if patient.temperature and patient.temperature >= 99.6 else ""
-            )
-            data_status = (
-                "DATA ISSUE ❌" if patient.patient_id in data_quality_ids else ""
-            )
-            print(
-                f"  {patient.patient_id}: Total={breakdown['total_score']} "
-                f"(BP={breakdown['bp_score']}, Temp={breakdown['temp_score']}, Age={breakdown['age_score']}) "
-                f"{status} {fever_status} {data_status}"
+            total_score = breakdown["total_score"]
+            temperature = patient.temperature
+            # Labels come from each patient's own fields, not ID lookups
+            is_fever = temperature is not None and temperature >= FEVER_THRESHOLD
+            has_data_issue = bool(get_data_quality_issues((patient,)))
+            rows.append(
+                f"  {patient.patient_id}: Total={total_score} "
+                f"(BP={breakdown['bp_score']}, Temp={breakdown['temp_score']}, "
+                f"Age={breakdown['age_score']}) "
+                f"{_STATUS[total_score >= HIGH_RISK_THRESHOLD]} "
+                f"{_FEVER[is_fever]} "
+                f"{_DATA_ISSUE[has_data_issue]}"
             )
+        sys.stdout.write("\n".join(rows) + "\n")
 
     # Validate results
     passed = True
@@ -80,173 +114,241 @@ def run_test(
     return passed
 
 
-def test_case_1_boundary_high_risk_score():
-    """Test Case 1: Boundary test for high-risk score = 4"""
-    patients = [
-        # BP=0, Temp=0, Age=0: Score = 0
-        Patient("TEST001", 35, "119/79", 98.6),
-        # BP=0, Temp=0, Age=2: Score = 2
-        Patient("TEST002", 70, "119/79", 98.6),
-        # BP=1, Temp=0, Age=0: Score = 1
-        Patient("TEST003", 35, "128/79", 98.6),
-        # BP=2, Temp=1, Age=1: Score = 4
-        Patient("TEST004", 50, "135/79", 99.6),
-    ]
-    return run_test(
-        "Boundary Test: High-Risk Score = 4",
-        patients,
-        expected_high_risk=1,  # TEST004 only
-        expected_fever=1,  # TEST004
-        expected_data_quality=0,
+# Test Case 1: Boundary test for high-risk score = 4
+_FIXTURE_1 = (
+    # BP=0, Temp=0, Age=0: Score = 0
+    Patient("TEST001", 35, "119/79", 98.6),
+    # BP=0, Temp=0, Age=2: Score = 2
+    Patient("TEST002", 70, "119/79", 98.6),
+    # BP=1, Temp=0, Age=0: Score = 1
+    Patient("TEST003", 35, "128/79", 98.6),
+    # BP=2, Temp=1, Age=1: Score = 4
+    Patient("TEST004", 50, "135/79", 99.6),
+)
+
+
+# Test Case 2: Boundary test for fever temperature = 99.6°F
+_FIXTURE_2 = (
+    # BP=2, Temp=0, Age=1: Score = 3
+    Patient("TEST005", 45, "120/80", 99.5),
+    # BP=2, Temp=1, Age=1: Score = 4
+    Patient("TEST006", 45, "120/80", 99.6),
+    # BP=2, Temp=1, Age=1: Score = 4
+    Patient("TEST007", 45, "120/80", 100.0),
+    # BP=2, Temp=2, Age=1: Score = 5
+    Patient("TEST008", 45, "120/80", 101.5),
+    # Just below the fever threshold: no temperature risk, not a fever
+    # BP=1, Temp=0, Age=1: Score = 2
+    Patient("TEST043", 45, "125/75", 99.55),
+    # Just below the high fever band: low fever risk
+    # BP=2, Temp=1, Age=1: Score = 4
+    Patient("TEST048", 45, "120/80", 100.95),
+)
+
+
+# Test Case 3: Blood pressure risk stage transitions
+_FIXTURE_3 = (
+    # BP=0 Temp=0 Age=1: Score = 1
+    Patient("TEST009", 40, "115/75", 98.6),
+    # BP=1 Temp=0 Age=1: Score = 2
+    Patient("TEST010", 40, "125/75", 98.6),
+    # BP=2 Temp=0 Age=1: Score = 3
+    Patient("TEST011", 40, "135/75", 98.6),
+    # BP=2 Temp=0 Age=1: Score = 3
+    Patient("TEST012", 40, "115/85", 98.6),
+    # BP=3 Temp=0 Age=1: Score = 4
+    Patient("TEST013", 40, "145/75", 98.6),
+    # BP=3 Temp=0 Age=1: Score = 4
+    Patient("TEST014", 40, "115/95", 98.6),
+)
+
+
+# Test Case 4: Missing/invalid data handling
+_FIXTURE_4 = (
+    # Missing BP
+    # BP=0, Temp=0, Age=1: Score = 1
+    Patient("TEST015", 45, None, 98.6),
+    # Missing temperature
+    # BP=2, Temp=0, Age=1: Score = 3
+    Patient("TEST016", 45, "120/80", None),
+    # Missing age
+    # BP=2, Temp=0, Age=0: Score = 2
+    Patient("TEST017", None, "120/80", 98.6),
+    # All valid
+    # BP=2, Temp=0, Age=1: Score = 3
+    Patient("TEST018", 45, "120/80", 98.6),
+    # Missing age
+    # BP=2, Temp=2, Age=0: Score = 4
+    Patient("TEST019", None, "120/80", 101.0),
+)
+
+
+# Test Case 7: Invalid blood pressure formats
+_FIXTURE_7 = (
+    # Invalid format - incomplete
+    # BP=0, Temp=0, Age=1: Score = 1
+    Patient("TEST028", 45, "120/", 98.6),
+    # Invalid format - missing systolic
+    # BP=0, Temp=0, Age=1: Score = 1
+    Patient("TEST029", 45, "/80", 98.6),
+    # Invalid format - non-numeric
+    # BP=0, Temp=0, Age=1: Score = 1
+    Patient("TEST030", 45, "INVALID", 98.6),
+    # Valid format
+    # BP=2, Temp=0, Age=1: Score = 3
+    Patient("TEST031", 45, "120/80", 98.6),
+)
+
+
+# Test Case 9: Mix of valid and invalid data across all fields
+_FIXTURE_9 = (
+    # All valid, high-risk
+    # BP=3, Temp=2, Age=2: Score = 7
+    Patient("TEST035", 70, "145/95", 101.0),
+    # Valid but low risk
+    # BP=0, Temp=0, Age=0: Score = 0
+    Patient("TEST036", 35, "115/75", 98.0),
+    # Missing all critical fields
+    # BP=0, Temp=0, Age=0: Score = 0
+    Patient("TEST037", None, None, None),
+    # Partial data - missing BP only High Risk
+    # BP=0, Temp=2, Age=2: Score = 4
+    Patient("TEST038", 70, None, 101.0),
+)
+
+
+# Test Case 10: Edge cases with extreme but valid values
+_FIXTURE_10 = (
+    # Very high BP (within valid range)
+    # BP=3, Temp=0, Age=1: Score = 4
+    Patient("TEST039", 40, "200/120", 98.6),
+    # Very old patient
+    # BP=2, Temp=0, Age=2: Score = 4
+    Patient("TEST040", 100, "120/80", 98.6),
+    # Very young patient with high fever
+    # BP=0, Temp=2, Age=0: Score = 2
+    Patient("TEST041", 18, "115/75", 103.5),
+    # All maximum risk factors
+    # BP=3, Temp=2, Age=2: Score = 7
+    Patient("TEST042", 80, "180/100", 102.0),
+)
+
+
+# Test Case 11: Raw API records go through the sanitizer before classifying
+_FIXTURE_11 = tuple(
+    sanitize_patient(raw)
+    for raw in (
+        # Numeric strings are converted
+        # BP=3, Temp=2, Age=2: Score = 7
+        {
+            "patient_id": "TEST044",
+            "age": "72",
+            "blood_pressure": "150/95",
+            "temperature": "101.2",
+        },
+        # Non-numeric age becomes None
+        # BP=2, Temp=0, Age=0: Score = 2
+        {
+            "patient_id": "TEST045",
+            "age": "fifty-three",
+            "blood_pressure": "120/80",
+            "temperature": 98.6,
+        },
+        # Placeholder BP and temperature become None
+        # BP=0, Temp=0, Age=1: Score = 1
+        {
+            "patient_id": "TEST046",
+            "age": 45,
+            "blood_pressure": "INVALID_BP_FORMAT",
+            "temperature": "TEMP_ERROR",
+        },
+        # Surrounding whitespace is stripped from BP
+        # BP=0, Temp=1, Age=0: Score = 1
+        {
+            "patient_id": "TEST047",
+            "age": 30,
+            "blood_pressure": " 118/76 ",
+            "temperature": 99.8,
+        },
     )
+)
 
 
-def test_case_2_fever_boundary():
-    """Test Case 2: Boundary test for fever temperature = 99.6°F"""
-    patients = [
-        # BP=2, Temp=0, Age=1: Score = 3
-        Patient("TEST005", 45, "120/80", 99.5),
-        # BP=2, Temp=1, Age=1: Score = 4
-        Patient("TEST006", 45, "120/80", 99.6),
-        # BP=2, Temp=1, Age=1: Score = 4
-        Patient("TEST007", 45, "120/80", 100.0),
-        # BP=2, Temp=2, Age=1: Score = 5
-        Patient("TEST008", 45, "120/80", 101.5),
-    ]
-    return run_test(
+# (test name, patients, expected high-risk, expected fever, expected data quality)
+CASES = [
+    (
+        "Boundary Test: High-Risk Score = 4",
+        _FIXTURE_1,
+        1,  # high-risk: TEST004 only
+        1,  # fever: TEST004
+        0,  # data quality
+    ),
+    (
         "Boundary Test: Fever Temperature = 99.6°F",
-        patients,
-        expected_high_risk=3,  # TEST008
-        expected_fever=3,  # TEST006, TEST007, TEST008
-        expected_data_quality=0,
-    )
-
-
-def test_case_3_bp_risk_stages():
-    """Test Case 3: Blood pressure risk stage transitions"""
-    patients = [
-        # BP=0 Temp=0 Age=1: Score = 1
-        Patient("TEST009", 40, "115/75", 98.6),
-        # BP=1 Temp=0 Age=1: Score = 2
-        Patient("TEST010", 40, "125/75", 98.6),
-        # BP=2 Temp=0 Age=1: Score = 3
-        Patient("TEST011", 40, "135/75", 98.6),
-        # BP=2 Temp=0 Age=1: Score = 3
-        Patient("TEST012", 40, "115/85", 98.6),
-        # BP=3 Temp=0 Age=1: Score = 4
-        Patient("TEST013", 40, "145/75", 98.6),
-        # BP=3 Temp=0 Age=1: Score = 4
-        Patient("TEST014", 40, "115/95", 98.6),
-    ]
-    return run_test(
+        _FIXTURE_2,
+        4,  # high-risk: TEST006, TEST007, TEST008, TEST048
+        4,  # fever: TEST006, TEST007, TEST008, TEST048
+        0,  # data quality
+    ),
+    (
         "Blood Pressure Risk Stage Transitions",
-        patients,
-        expected_high_risk=2,  # TEST013, TEST014
-        expected_fever=0,
-        expected_data_quality=0,
-    )
-
-
-def test_case_4_missing_data():
-    """Test Case 4: Missing/invalid data handling"""
-    patients = [
-        # Missing BP
-        # BP=0, Temp=0, Age=1: Score = 1
-        Patient("TEST015", 45, None, 98.6),
-        # Missing temperature
-        # BP=2, Temp=0, Age=1: Score = 3
-        Patient("TEST016", 45, "120/80", None),
-        # Missing age
-        # BP=2, Temp=0, Age=0: Score = 2
-        Patient("TEST017", None, "120/80", 98.6),
-        # All valid
-        # BP=2, Temp=0, Age=1: Score = 3
-        Patient("TEST018", 45, "120/80", 98.6),
-        # Missing age
-        # BP=2, Temp=2, Age=0: Score = 4
-        Patient("TEST019", None, "120/80", 101.0),
-    ]
-    return run_test(
+        _FIXTURE_3,
+        2,  # high-risk: TEST013, TEST014
+        0,  # fever
+        0,  # data quality
+    ),
+    (
         "Missing/Invalid Data Handling",
-        patients,
-        expected_high_risk=1,  # TEST019
-        expected_fever=1,  # TEST019
-        expected_data_quality=4,  # TEST015, TEST016, TEST017, TEST019
-    )
-
-
-def test_case_7_invalid_bp_formats():
-    """Test Case 7: Invalid blood pressure formats"""
-    patients = [
-        # Invalid format - incomplete
-        # BP=0, Temp=0, Age=1: Score = 1
-        Patient("TEST028", 45, "120/", 98.6),
-        # Invalid format - missing systolic
-        # BP=0, Temp=0, Age=1: Score = 1
-        Patient("TEST029", 45, "/80", 98.6),
-        # Invalid format - non-numeric
-        # BP=0, Temp=0, Age=1: Score = 1
-        Patient("TEST030", 45, "INVALID", 98.6),
-        # Valid format
-        # BP=2, Temp=0, Age=1: Score = 3
-        Patient("TEST031", 45, "120/80", 98.6),
-    ]
-    return run_test(
+        _FIXTURE_4,
+        1,  # high-risk: TEST019
+        1,  # fever: TEST019
+        4,  # data quality: TEST015, TEST016, TEST017, TEST019
+    ),
+    (
         "Invalid Blood Pressure Formats",
-        patients,
-        expected_high_risk=0,
-        expected_fever=0,
-        expected_data_quality=3,  # TEST028, TEST029, TEST030
-    )
-
-
-def test_case_9_mixed_data_quality():
-    """Test Case 9: Mix of valid and invalid data across all fields"""
-    patients = [
-        # All valid, high-risk
-        # BP=3, Temp=2, Age=2: Score = 7
-        Patient("TEST035", 70, "145/95", 101.0),
-        # Valid but low risk
-        # BP=0, Temp=0, Age=0: Score = 0
-        Patient("TEST036", 35, "115/75", 98.0),
-        # Missing all critical fields
-        # BP=0, Temp=0, Age=0: Score = 0
-        Patient("TEST037", None, None, None),
-        # Partial data - missing BP only High Risk
-        # BP=0, Temp=2, Age=2: Score = 4
-        Patient("TEST038", 70, None, 101.0),
-    ]
-    return run_test(
+        _FIXTURE_7,
+        0,  # high-risk
+        0,  # fever
+        3,  # data quality: TEST028, TEST029, TEST030
+    ),
+    (
         "Mixed Data Quality",
-        patients,
-        expected_high_risk=2,
-        expected_fever=2,
-        expected_data_quality=2,
-    )
-
-
-def test_case_10_edge_case_extreme_values():
-    """Test Case 10: Edge cases with extreme but valid values"""
-    patients = [
-        # Very high BP (within valid range)
-        # BP=3, Temp=0, Age=1: Score = 4
-        Patient("TEST039", 40, "200/120", 98.6),
-        # Very old patient
-        # BP=2, Temp=0, Age=2: Score = 4
-        Patient("TEST040", 100, "120/80", 98.6),
-        # Very young patient with high fever
-        # BP=0, Temp=2, Age=0: Score = 2
-        Patient("TEST041", 18, "115/75", 103.5),
-        # All maximum risk factors
-        # BP=3, Temp=2, Age=2: Score = 7
-        Patient("TEST042", 80, "180/100", 102.0),
-    ]
-    return run_test(
+        _FIXTURE_9,
+        2,  # high-risk
+        2,  # fever
+        2,  # data quality
+    ),
+    (
         "Edge Cases: Extreme Values",
-        patients,
-        expected_high_risk=3,
-        expected_fever=2,
-        expected_data_quality=0,
+        _FIXTURE_10,
+        3,  # high-risk
+        2,  # fever
+        0,  # data quality
+    ),
+    (
+        "Sanitized API Records",
+        _FIXTURE_11,
+        1,  # high-risk: TEST044
+        2,  # fever: TEST044, TEST047
+        2,  # data quality: TEST045, TEST046
+    ),
+]
+
+
+@pytest.mark.parametrize("case", CASES, ids=[case[0] for case in CASES])
+def test_case(case):
+    """Pytest entry point: each case in CASES is reported separately."""
+    assert run_test(*case), f"Failed test case: {case[0]}"
+
+
+@pytest.mark.parametrize("case", CASES, ids=[case[0] for case in CASES])
+def test_classify_all_matches_standalone(case):
+    """classify_all must return what the three standalone classifiers do."""
+    patients = case[1]
+    assert classify_all(patients) == (
+        get_high_risk_patients(patients),
+        get_fever_patients(patients),
+        get_data_quality_issues(patients),
     )
 
 
@@ -255,20 +357,9 @@ def main():
     print("\n" + "=" * 80)
     print("PATIENT CLASSIFICATION SYSTEM - TEST SUITE")
     print("=" * 80)
-    print("\nRunning 10 test cases to validate classifier accuracy...")
-
-    test_results = []
-
-    # Run all test cases
-    test_results.append(test_case_1_boundary_high_risk_score())
-    test_results.append(test_case_2_fever_boundary())
-    test_results.append(test_case_3_bp_risk_stages())
-    test_results.append(test_case_4_missing_data())
-
-    test_results.append(test_case_7_invalid_bp_formats())
+    print(f"\nRunning {len(CASES)} test cases to validate classifier accuracy...")
 
-    test_results.append(test_case_9_mixed_data_quality())
-    test_results.append(test_case_10_edge_case_extreme_values())
+    test_results = [run_test(*case) for case in CASES]
 
     # Summary
     print("\n" + "=" * 80)
@@ -0,0 +1,90 @@
+"""
+Test Cases for Patient Page Fetching
+
+Runs getPatients against a stubbed HTTP session to check page ordering,
+skipping of unusable pages, and request pacing.
+"""
+
+import threading
+import time
+
+import routes
+
+TOTAL_PAGES = 5
+FAILED_PAGE = 3  # Responds with a server error
+BAD_JSON_PAGE = 4  # Responds 200 with a body that is not JSON
+
+
+class _StubResponse:
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.text = str(body)
+        self._body = body
+
+    def json(self):
+        if self._body is None:
+            raise ValueError("Expecting value: line 1 column 1 (char 0)")
+        return self._body
+
+
+class _StubSession:
+    """Serves TOTAL_PAGES pages of one patient each and records request start times."""
+
+    def __init__(self):
+        self.starts = []
+        self._lock = threading.Lock()
+
+    def get(self, url, headers=None, timeout=None):
+        page = int(url.rsplit("page=", 1)[1])
+        with self._lock:
+            self.starts.append(time.monotonic())
+        time.sleep(0.01)  # Simulated network latency
+
+        if page == FAILED_PAGE:
+            return _StubResponse(500, "Internal Server Error")
+        if page == BAD_JSON_PAGE:
+            return _StubResponse(200, None)
+        return _StubResponse(
+            200,
+            {
+                "data": [
+                    {
+                        "patient_id": f"DEMO{page:03d}",
+                        "age": 45,
+                        "blood_pressure": "120/80",
+                        "temperature": 98.6,
+                    }
+                ],
+                "pagination": {
+                    "page": page,
+                    "totalPages": TOTAL_PAGES,
+                    "hasNext": page < TOTAL_PAGES,
+                },
+            },
+        )
+
+
+def _get_patients(monkeypatch, interval=0.05):
+    stub = _StubSession()
+    monkeypatch.setattr(routes, "session", stub)
+    monkeypatch.setattr(routes, "REQUEST_INTERVAL", interval)
+    return routes.getPatients(), stub
+
+
+def test_pages_keep_api_order_and_skip_unusable_pages(monkeypatch):
+    result, stub = _get_patients(monkeypatch)
+
+    patient_ids = [patient.patient_id for patient in result["data"]]
+    assert patient_ids == ["DEMO001", "DEMO002", "DEMO005"]
+    assert len(stub.starts) == TOTAL_PAGES
+    assert result["metadata"]["sourcePages"] == TOTAL_PAGES
+
+
+def test_requests_start_at_most_once_per_interval(monkeypatch):
+    interval = 0.05
+    _, stub = _get_patients(monkeypatch, interval)
+
+    starts = sorted(stub.starts)
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+    # Small allowance for timer jitter
+    assert min(gaps) >= interval * 0.9, gaps